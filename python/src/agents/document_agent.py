@@ -9,32 +9,109 @@ with our existing MCP project management tools.
 import json
 import logging
 import os
+import re
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_ai import Agent, RunContext
 
 from .base_agent import ArchonDependencies, BaseAgent
-from .mcp_client import get_mcp_client
+from .mcp_client import get_mcp_client, json_loads
 
 logger = logging.getLogger(__name__)
 
 
+# ERD column types inferred from attribute names, in priority order (first match wins)
+_ATTRIBUTE_TYPES = (
+    ("id", "UUID"),
+    ("email", "VARCHAR(255) UNIQUE"),
+    ("password", "VARCHAR(255)"),
+    ("timestamp", "TIMESTAMP"),
+    ("integer", "INTEGER"),
+    ("decimal", "DECIMAL(10,2)"),
+    ("boolean", "BOOLEAN"),
+)
+
+# Single scan over the attribute name; the lookahead lets overlapping keywords all match
+_ATTRIBUTE_TYPE_PATTERN = re.compile(
+    r"(?=(?P<id>id)|(?P<email>email)|(?P<password>password)|(?P<timestamp>created|updated)"
+    r"|(?P<integer>count|number)|(?P<decimal>price|cost)|(?P<boolean>active|enabled))",
+    re.IGNORECASE,
+)
+
+
+def _infer_attribute_type(attr_name: str) -> str:
+    """Infer a SQL column type from an attribute name, defaulting to VARCHAR(255)."""
+    matched = {match.lastgroup for match in _ATTRIBUTE_TYPE_PATTERN.finditer(attr_name)}
+    for group, attr_type in _ATTRIBUTE_TYPES:
+        if group in matched:
+            return attr_type
+    return "VARCHAR(255)"
+
+
+# Static parts of generated feature plan, ERD and approval documents. They are immutable
+# so they can be shared across calls; any mapping is copied into the document payload.
+# React Flow steps after the feature-specific start node: (id, node type, x position, label)
+_FEATURE_PLAN_STEP_NODES = (
+    ("user_input", "default", 300, "User Input/Action"),
+    ("validation", "default", 500, "Validation Logic"),
+    ("processing", "default", 700, "Core Processing"),
+    ("response", "output", 900, "User Response/Result"),
+)
+# (edge id, source node, target node)
+_FEATURE_PLAN_EDGES = (
+    ("e1", "start", "user_input"),
+    ("e2", "user_input", "validation"),
+    ("e3", "validation", "processing"),
+    ("e4", "processing", "response"),
+)
+_FEATURE_PLAN_VIEWPORT = MappingProxyType({"x": 0, "y": 0, "zoom": 1})
+_FEATURE_PLAN_ACCEPTANCE_CRITERIA = (
+    "User can successfully complete the main flow",
+    "All edge cases are handled gracefully",
+    "Performance meets requirements",
+)
+_ERD_RELATIONSHIP_TYPES = ("one-to-one", "one-to-many", "many-to-many")
+_ERD_DEFAULT_INDEXES = (
+    "CREATE INDEX idx_created_at ON each_table (created_at);",
+    "CREATE INDEX idx_updated_at ON each_table (updated_at);",
+)
+_ERD_NOTES = MappingProxyType({
+    "diagram_tool": "Can be visualized using tools like dbdiagram.io, Draw.io, or Lucidchart",
+    "normalization_level": "3NF recommended",
+    "scalability_notes": "Consider partitioning for large tables",
+})
+_APPROVAL_STAKEHOLDERS = ("Product Team", "Development Team", "QA Team")
+_APPROVAL_REQUIRED_APPROVERS = ("Product Manager", "Technical Lead")
+
+
+def _flow_node(node_id: str, node_type: str, x: int, label: str) -> dict[str, Any]:
+    """Build a React Flow node on the feature plan's single row."""
+    return {"id": node_id, "type": node_type, "position": {"x": x, "y": 100}, "data": {"label": label}}
+
+
+async def _noop_progress_callback(update: dict[str, Any]) -> None:
+    """Progress callback used when nobody is listening, so tools can report unconditionally."""
+
+
 @dataclass
 class DocumentDependencies(ArchonDependencies):
     """Dependencies for document operations."""
 
     project_id: str = ""  # Required but needs default value due to parent class having defaults
     current_document_id: str | None = None
-    progress_callback: Any | None = None  # Callback for progress updates
+    progress_callback: Any = _noop_progress_callback  # Callback for progress updates
 
 
 class DocumentOperation(BaseModel):
     """Structured output for document operations."""
 
+    model_config = ConfigDict(frozen=True)
+
     operation_type: str = Field(description="Type of operation: create, update, delete, query")
     document_id: str | None = Field(description="ID of the document affected")
     document_type: str | None = Field(
@@ -49,35 +126,10 @@ class DocumentOperation(BaseModel):
     )
 
 
-class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
-    """
-    Conversational agent for document management.
-
-    Capabilities:
-    - Create new documents through conversation
-    - Update existing document content
-    - Modify document structure and metadata
-    - Query document information
-    - Version control tracking
-    """
-
-    def __init__(self, model: str = None, **kwargs):
-        # Use provided model or fall back to default
-        if model is None:
-            model = os.getenv("DOCUMENT_AGENT_MODEL", "openai:gpt-4o")
-
-        super().__init__(
-            model=model, name="DocumentAgent", retries=3, enable_rate_limiting=True, **kwargs
-        )
-
-    def _create_agent(self, **kwargs) -> Agent:
-        """Create the PydanticAI agent with tools and prompts."""
-
-        agent = Agent(
-            model=self.model,
-            deps_type=DocumentDependencies,
-            result_type=DocumentOperation,
-            system_prompt="""You are a Document Management Assistant that helps users create, update, and modify project documents through conversation.
+# Static instructions live at module level so the exact bytes are identical on
+# every run; providers with prefix caching can then reuse them. Per-run context
+# (project, timestamp) is appended afterwards by the dynamic system prompt.
+DOCUMENT_AGENT_SYSTEM_PROMPT = """You are a Document Management Assistant that helps users create, update, and modify project documents through conversation.
 
 **Your Capabilities:**
 - Create new documents (PRDs, technical specs, meeting notes, API docs, etc.)
@@ -123,11 +175,43 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
 **✅ Change Management:**
 - "Request approval for the API changes" → Use request_approval tool
 - "Submit PRD updates for review" → Use request_approval tool
-- "Create approval workflow for database changes" → Use request_approval tool""",
+- "Create approval workflow for database changes" → Use request_approval tool"""
+
+
+class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
+    """
+    Conversational agent for document management.
+
+    Capabilities:
+    - Create new documents through conversation
+    - Update existing document content
+    - Modify document structure and metadata
+    - Query document information
+    - Version control tracking
+    """
+
+    def __init__(self, model: str = None, **kwargs):
+        # Use provided model or fall back to default
+        if model is None:
+            model = os.getenv("DOCUMENT_AGENT_MODEL", "openai:gpt-4o")
+
+        super().__init__(
+            model=model, name="DocumentAgent", retries=3, enable_rate_limiting=True, **kwargs
+        )
+
+    def _create_agent(self, **kwargs) -> Agent:
+        """Create the PydanticAI agent with tools and prompts."""
+
+        agent = Agent(
+            model=self.model,
+            deps_type=DocumentDependencies,
+            result_type=DocumentOperation,
+            system_prompt=DOCUMENT_AGENT_SYSTEM_PROMPT,
             **kwargs,
         )
 
         # Register dynamic system prompt for project context
+        # (timestamp is minute-granular so the prompt stays identical across quick turns)
         @agent.system_prompt
         async def add_project_context(ctx: RunContext[DocumentDependencies]) -> str:
             return f"""
@@ -135,7 +219,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
 - Project ID: {ctx.deps.project_id}
 - User ID: {ctx.deps.user_id or "Unknown"}
 - Current Document: {ctx.deps.current_document_id or "None"}
-- Timestamp: {datetime.now().isoformat()}
+- Timestamp: {datetime.now().isoformat(timespec="minutes")}
 """
 
         # Register tools for document operations
@@ -190,31 +274,31 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     return "No project found."
 
                 docs = response.data[0].get("docs", [])
-                matching_docs = [
-                    doc for doc in docs if document_title.lower() in doc.get("title", "").lower()
-                ]
+                needle = document_title.lower()
+                doc = next((doc for doc in docs if needle in doc.get("title", "").lower()), None)
 
-                if not matching_docs:
+                if doc is None:
                     available_docs = [doc.get("title", "Untitled") for doc in docs[:5]]
                     return f"No document found matching '{document_title}'. Available documents: {', '.join(available_docs)}"
 
-                doc = matching_docs[0]
                 content = doc.get("content", {})
 
                 # Format content for display
-                content_str = ""
                 if isinstance(content, dict):
+                    content_parts = []
                     for key, value in content.items():
+                        heading = key.replace("_", " ").title()
                         if isinstance(value, list):
-                            content_str += f"\n**{key.replace('_', ' ').title()}:**\n" + "\n".join([
-                                f"- {item}" for item in value
-                            ])
+                            content_parts.append(f"\n**{heading}:**\n")
+                            content_parts.append("\n".join([f"- {item}" for item in value]))
                         elif isinstance(value, dict):
-                            content_str += f"\n**{key.replace('_', ' ').title()}:**\n"
-                            for subkey, subvalue in value.items():
-                                content_str += f"  - {subkey}: {subvalue}\n"
+                            content_parts.append(f"\n**{heading}:**\n")
+                            content_parts.extend(
+                                f"  - {subkey}: {subvalue}\n" for subkey, subvalue in value.items()
+                            )
                         else:
-                            content_str += f"\n**{key.replace('_', ' ').title()}:** {value}"
+                            content_parts.append(f"\n**{heading}:** {value}")
+                    content_str = "".join(content_parts)
                 else:
                     content_str = str(content)
 
@@ -233,12 +317,11 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
         ) -> str:
             """Create a new document with structured content based on the description."""
             try:
-                # Send progress update if callback available
-                if ctx.deps.progress_callback:
-                    await ctx.deps.progress_callback({
-                        "step": "ai_generation",
-                        "log": f"📝 Creating {document_type}: {title}",
-                    })
+                # Send progress update
+                await ctx.deps.progress_callback({
+                    "step": "ai_generation",
+                    "log": f"📝 Creating {document_type}: {title}",
+                })
 
                 # Generate blocks for the document
                 blocks = self._convert_to_blocks(title, document_type, content_description)
@@ -262,23 +345,21 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                 if result_data.get("success", False):
                     doc_id = result_data.get("document_id", "unknown")
 
-                    # Send success progress update if callback available
-                    if ctx.deps.progress_callback:
-                        await ctx.deps.progress_callback({
-                            "step": "ai_generation",
-                            "log": f"✅ Successfully created {document_type}: {title}",
-                        })
+                    # Send success progress update
+                    await ctx.deps.progress_callback({
+                        "step": "ai_generation",
+                        "log": f"✅ Successfully created {document_type}: {title}",
+                    })
 
                     return f"Successfully created document '{title}' of type '{document_type}'. Document ID: {doc_id}"
                 else:
                     error_msg = result_data.get("error", "Unknown error")
 
-                    # Send error progress update if callback available
-                    if ctx.deps.progress_callback:
-                        await ctx.deps.progress_callback({
-                            "step": "ai_generation",
-                            "log": f"❌ Failed to create document: {error_msg}",
-                        })
+                    # Send error progress update
+                    await ctx.deps.progress_callback({
+                        "step": "ai_generation",
+                        "log": f"❌ Failed to create document: {error_msg}",
+                    })
 
                     return f"Failed to create document: {error_msg}"
 
@@ -303,7 +384,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                 )
 
                 # Parse the response
-                get_data = json.loads(get_result)
+                get_data = json_loads(get_result)
                 if not get_data.get("success", False):
                     return f"Failed to get document: {get_data.get('error', 'Unknown error')}"
 
@@ -351,7 +432,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     version=f"{float(doc.get('version', '1.0')) + 0.1:.1f}",
                 )
 
-                result_data = json.loads(update_result)
+                result_data = json_loads(update_result)
                 if result_data.get("success"):
                     return f"Successfully updated section '{section_to_update}' in document '{document_title}'. Change: {update_description}"
                 else:
@@ -370,45 +451,14 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
         ) -> str:
             """Create a React Flow feature plan with nodes and connections."""
             try:
-                # Generate React Flow nodes and edges for the feature
+                # Generate React Flow nodes and edges for the feature; only the start node varies
                 nodes = [
-                    {
-                        "id": "start",
-                        "type": "input",
-                        "position": {"x": 100, "y": 100},
-                        "data": {"label": f"Start: {feature_name}"},
-                    },
-                    {
-                        "id": "user_input",
-                        "type": "default",
-                        "position": {"x": 300, "y": 100},
-                        "data": {"label": "User Input/Action"},
-                    },
-                    {
-                        "id": "validation",
-                        "type": "default",
-                        "position": {"x": 500, "y": 100},
-                        "data": {"label": "Validation Logic"},
-                    },
-                    {
-                        "id": "processing",
-                        "type": "default",
-                        "position": {"x": 700, "y": 100},
-                        "data": {"label": "Core Processing"},
-                    },
-                    {
-                        "id": "response",
-                        "type": "output",
-                        "position": {"x": 900, "y": 100},
-                        "data": {"label": "User Response/Result"},
-                    },
+                    _flow_node("start", "input", 100, f"Start: {feature_name}"),
+                    *(_flow_node(*step) for step in _FEATURE_PLAN_STEP_NODES),
                 ]
-
                 edges = [
-                    {"id": "e1", "source": "start", "target": "user_input"},
-                    {"id": "e2", "source": "user_input", "target": "validation"},
-                    {"id": "e3", "source": "validation", "target": "processing"},
-                    {"id": "e4", "source": "processing", "target": "response"},
+                    {"id": edge_id, "source": source, "target": target}
+                    for edge_id, source, target in _FEATURE_PLAN_EDGES
                 ]
 
                 # Create feature plan document
@@ -423,13 +473,9 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     "react_flow_diagram": {
                         "nodes": nodes,
                         "edges": edges,
-                        "viewport": {"x": 0, "y": 0, "zoom": 1},
+                        "viewport": dict(_FEATURE_PLAN_VIEWPORT),
                     },
-                    "acceptance_criteria": [
-                        "User can successfully complete the main flow",
-                        "All edge cases are handled gracefully",
-                        "Performance meets requirements",
-                    ],
+                    "acceptance_criteria": _FEATURE_PLAN_ACCEPTANCE_CRITERIA,
                     "technical_notes": {
                         "frontend_components": [
                             f"{feature_name}Container",
@@ -459,7 +505,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     action="add_feature", project_id=ctx.deps.project_id, feature=new_feature
                 )
 
-                result_data = json.loads(result_json)
+                result_data = json_loads(result_json)
 
                 if result_data.get("success", False):
                     return f"Successfully created React Flow feature plan for '{feature_name}'. The plan includes a visual flow with 5 nodes and user story breakdown. You can now view and edit this in the project documents."
@@ -498,23 +544,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     elif line.startswith("-") and current_entity:
                         # Attribute of current entity
                         attr_name = line[1:].strip()
-                        attr_type = "VARCHAR(255)"  # Default type
-
-                        # Detect common patterns
-                        if "id" in attr_name.lower():
-                            attr_type = "UUID"
-                        elif "email" in attr_name.lower():
-                            attr_type = "VARCHAR(255) UNIQUE"
-                        elif "password" in attr_name.lower():
-                            attr_type = "VARCHAR(255)"
-                        elif "created" in attr_name.lower() or "updated" in attr_name.lower():
-                            attr_type = "TIMESTAMP"
-                        elif "count" in attr_name.lower() or "number" in attr_name.lower():
-                            attr_type = "INTEGER"
-                        elif "price" in attr_name.lower() or "cost" in attr_name.lower():
-                            attr_type = "DECIMAL(10,2)"
-                        elif "active" in attr_name.lower() or "enabled" in attr_name.lower():
-                            attr_type = "BOOLEAN"
+                        attr_type = _infer_attribute_type(attr_name)
 
                         current_entity["attributes"].append({
                             "name": attr_name,
@@ -526,17 +556,21 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                 # Generate SQL schema
                 sql_schema = []
                 for entity in entities:
-                    table_sql = f"CREATE TABLE {entity['name'].lower().replace(' ', '_')} (\n"
-                    table_sql += "    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),\n"
+                    table_lines = [
+                        f"CREATE TABLE {entity['name'].lower().replace(' ', '_')} (",
+                        "    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),",
+                    ]
 
                     for attr in entity["attributes"]:
                         nullable = "NULL" if attr["nullable"] else "NOT NULL"
-                        table_sql += f"    {attr['name'].lower().replace(' ', '_')} {attr['type']} {nullable},\n"
+                        table_lines.append(
+                            f"    {attr['name'].lower().replace(' ', '_')} {attr['type']} {nullable},"
+                        )
 
-                    table_sql += "    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,\n"
-                    table_sql += "    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP\n"
-                    table_sql += ");"
-                    sql_schema.append(table_sql)
+                    table_lines.append("    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,")
+                    table_lines.append("    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
+                    table_lines.append(");")
+                    sql_schema.append("\n".join(table_lines))
 
                 # Create ERD document
                 content = {
@@ -548,22 +582,15 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     "entities": entities,
                     "relationships": {
                         "description": relationships_description,
-                        "relationship_types": ["one-to-one", "one-to-many", "many-to-many"],
+                        "relationship_types": _ERD_RELATIONSHIP_TYPES,
                         "foreign_keys": "To be defined based on relationships",
                     },
                     "database_schema": {
                         "sql_statements": sql_schema,
-                        "indexes": [
-                            "CREATE INDEX idx_created_at ON each_table (created_at);",
-                            "CREATE INDEX idx_updated_at ON each_table (updated_at);",
-                        ],
+                        "indexes": _ERD_DEFAULT_INDEXES,
                         "constraints": "Foreign key constraints to be added based on relationships",
                     },
-                    "erd_notes": {
-                        "diagram_tool": "Can be visualized using tools like dbdiagram.io, Draw.io, or Lucidchart",
-                        "normalization_level": "3NF recommended",
-                        "scalability_notes": "Consider partitioning for large tables",
-                    },
+                    "erd_notes": dict(_ERD_NOTES),
                 }
 
                 # Create ERD via MCP
@@ -584,7 +611,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     action="add_data", project_id=ctx.deps.project_id, data=new_data_model
                 )
 
-                result_data = json.loads(result_json)
+                result_data = json_loads(result_json)
 
                 if result_data.get("success", False):
                     return f"Successfully created ERD for '{system_name}' with {len(entities)} entities. Generated SQL schema and relationship mappings. The ERD includes detailed entity definitions and can be imported into database design tools."
@@ -615,12 +642,12 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     },
                     "change_summary": change_summary,
                     "impact_analysis": {
-                        "affected_stakeholders": ["Product Team", "Development Team", "QA Team"],
+                        "affected_stakeholders": _APPROVAL_STAKEHOLDERS,
                         "risk_level": "medium",
                         "effort_estimate": "To be determined by reviewers",
                     },
                     "approval_workflow": {
-                        "required_approvers": ["Product Manager", "Technical Lead"],
+                        "required_approvers": _APPROVAL_REQUIRED_APPROVERS,
                         "approval_deadline": (datetime.now() + timedelta(days=3)).isoformat(),
                         "approval_status": {
                             "product_manager": "pending",
@@ -646,7 +673,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
                     author=ctx.deps.user_id or "DocumentAgent",
                 )
 
-                result_data = json.loads(result_json)
+                result_data = json_loads(result_json)
 
                 if result_data.get("success", False):
                     return f"Approval request created for changes to '{document_title}'. Status: Pending approval from Product Manager and Technical Lead. Deadline: 3 days. Change summary: {change_summary}"
@@ -832,7 +859,7 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
             project_id=project_id,
             user_id=user_id,
             current_document_id=current_document_id,
-            progress_callback=progress_callback,
+            progress_callback=progress_callback or _noop_progress_callback,
         )
 
         try:
@@ -841,8 +868,8 @@ class DocumentAgent(BaseAgent[DocumentDependencies, DocumentOperation]):
             return result
         except Exception as e:
             self.logger.error(f"Document operation failed: {str(e)}")
-            # Return error result
-            return DocumentOperation(
+            # Return error result (built from trusted values, so skip validation)
+            return DocumentOperation.model_construct(
                 operation_type="error",
                 document_id=None,
                 document_type=None,
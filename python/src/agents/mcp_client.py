@@ -6,15 +6,26 @@ Agents use this client to access all data operations through the MCP protocol
 instead of direct database access or service imports.
 """
 
-import json
 import logging
 from typing import Any
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+def json_loads(data: str | bytes) -> Any:
+    """Decode JSON returned by MCP tools."""
+    return orjson.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Encode MCP tool arguments and results."""
+    # Match json.dumps, which accepts non-string dict keys
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class MCPClient:
     """Client for calling MCP tools via HTTP."""
 
@@ -76,12 +87,12 @@ class MCPClient:
             # Make HTTP request to MCP server
             response = await self.client.post(
                 f"{self.mcp_url}/rpc",
-                json=request_data,
+                content=orjson.dumps(request_data, option=orjson.OPT_NON_STR_KEYS),
                 headers={"Content-Type": "application/json"},
             )
 
             response.raise_for_status()
-            result = response.json()
+            result = json_loads(response.content)
 
             if "error" in result:
                 error = result["error"]
@@ -103,12 +114,12 @@ class MCPClient:
         result = await self.call_tool(
             "perform_rag_query", query=query, source=source, match_count=match_count
         )
-        return json.dumps(result) if isinstance(result, dict) else str(result)
+        return json_dumps(result) if isinstance(result, dict) else str(result)
 
     async def get_available_sources(self) -> str:
         """Get available sources through MCP."""
         result = await self.call_tool("get_available_sources")
-        return json.dumps(result) if isinstance(result, dict) else str(result)
+        return json_dumps(result) if isinstance(result, dict) else str(result)
 
     async def search_code_examples(
         self, query: str, source_id: str = None, match_count: int = 5
@@ -117,24 +128,24 @@ class MCPClient:
         result = await self.call_tool(
             "search_code_examples", query=query, source_id=source_id, match_count=match_count
         )
-        return json.dumps(result) if isinstance(result, dict) else str(result)
+        return json_dumps(result) if isinstance(result, dict) else str(result)
 
     async def manage_project(self, action: str, **kwargs) -> str:
         """Manage projects through MCP."""
         result = await self.call_tool("manage_project", action=action, **kwargs)
-        return json.dumps(result) if isinstance(result, dict) else str(result)
+        return json_dumps(result) if isinstance(result, dict) else str(result)
 
     async def manage_document(self, action: str, project_id: str, **kwargs) -> str:
         """Manage documents through MCP."""
         result = await self.call_tool(
             "manage_document", action=action, project_id=project_id, **kwargs
         )
-        return json.dumps(result) if isinstance(result, dict) else str(result)
+        return json_dumps(result) if isinstance(result, dict) else str(result)
 
     async def manage_task(self, action: str, project_id: str, **kwargs) -> str:
         """Manage tasks through MCP."""
         result = await self.call_tool("manage_task", action=action, project_id=project_id, **kwargs)
-        return json.dumps(result) if isinstance(result, dict) else str(result)
+        return json_dumps(result) if isinstance(result, dict) else str(result)
 
 
 # Global MCP client instance (created on first use)
@@ -154,3 +165,12 @@ async def get_mcp_client() -> MCPClient:
         _mcp_client = MCPClient()
 
     return _mcp_client
+
+
+async def close_mcp_client() -> None:
+    """Close the global MCP client, if one was created."""
+    global _mcp_client
+
+    if _mcp_client is not None:
+        await _mcp_client.close()
+        _mcp_client = None
@@ -8,18 +8,45 @@ intelligent responses based on the retrieved information.
 
 import logging
 import os
+import re
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_ai import Agent, RunContext
 
 from .base_agent import ArchonDependencies, BaseAgent
-from .mcp_client import get_mcp_client
+from .mcp_client import get_mcp_client, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache for read-only tool responses that the agent tends to repeat
+# within a single conversation (e.g. listing sources before and after a search)
+_response_cache: dict[tuple, tuple[str, float]] = {}
+_RESPONSE_CACHE_TTL_SECONDS = 15
+
+# Used to pull the result count out of the agent's response text
+_RESULTS_FOUND_PATTERN = re.compile(r"found (\d+)")
+
+
+def _get_cached_response(key: tuple) -> str | None:
+    """Get a cached tool response if not expired."""
+    if key in _response_cache:
+        value, timestamp = _response_cache[key]
+        if time.time() - timestamp < _RESPONSE_CACHE_TTL_SECONDS:
+            return value
+        else:
+            # Expired, remove from cache
+            del _response_cache[key]
+    return None
+
+
+def _set_cached_response(key: tuple, value: str) -> None:
+    """Cache a tool response with current timestamp."""
+    _response_cache[key] = (value, time.time())
+
 
 @dataclass
 class RagDependencies(ArchonDependencies):
@@ -34,6 +61,8 @@ class RagDependencies(ArchonDependencies):
 class RagQueryResult(BaseModel):
     """Structured output for RAG query results."""
 
+    model_config = ConfigDict(frozen=True)
+
     query_type: str = Field(description="Type of query: search, explain, summarize, compare")
     original_query: str = Field(description="The original user query")
     refined_query: str | None = Field(
@@ -47,34 +76,8 @@ class RagQueryResult(BaseModel):
     message: str = Field(description="Status message or error description")
 
 
-class RagAgent(BaseAgent[RagDependencies, str]):
-    """
-    Conversational agent for RAG-based document search and retrieval.
-
-    Capabilities:
-    - Search documents using natural language queries
-    - Filter by specific sources
-    - Search code examples
-    - Provide synthesized answers with citations
-    - Explain concepts found in documentation
-    """
-
-    def __init__(self, model: str = None, **kwargs):
-        # Use provided model or fall back to default
-        if model is None:
-            model = os.getenv("RAG_AGENT_MODEL", "openai:gpt-4o-mini")
-
-        super().__init__(
-            model=model, name="RagAgent", retries=3, enable_rate_limiting=True, **kwargs
-        )
-
-    def _create_agent(self, **kwargs) -> Agent:
-        """Create the PydanticAI agent with tools and prompts."""
-
-        agent = Agent(
-            model=self.model,
-            deps_type=RagDependencies,
-            system_prompt="""You are a RAG (Retrieval-Augmented Generation) Assistant that helps users search and understand documentation through conversation.
+# Byte-stable prompt prefix; search context is added per run by add_search_context.
+RAG_AGENT_SYSTEM_PROMPT = """You are a RAG (Retrieval-Augmented Generation) Assistant that helps users search and understand documentation through conversation.
 
 **Your Capabilities:**
 - Search through crawled documentation using semantic search
@@ -108,11 +111,42 @@ class RagAgent(BaseAgent[RagDependencies, str]):
 - Include relevant quotes from sources
 - Cite sources with URLs when available
 - Admit when information is not found
-- Suggest alternative searches if needed""",
+- Suggest alternative searches if needed"""
+
+
+class RagAgent(BaseAgent[RagDependencies, str]):
+    """
+    Conversational agent for RAG-based document search and retrieval.
+
+    Capabilities:
+    - Search documents using natural language queries
+    - Filter by specific sources
+    - Search code examples
+    - Provide synthesized answers with citations
+    - Explain concepts found in documentation
+    """
+
+    def __init__(self, model: str = None, **kwargs):
+        # Use provided model or fall back to default
+        if model is None:
+            model = os.getenv("RAG_AGENT_MODEL", "openai:gpt-4o-mini")
+
+        super().__init__(
+            model=model, name="RagAgent", retries=3, enable_rate_limiting=True, **kwargs
+        )
+
+    def _create_agent(self, **kwargs) -> Agent:
+        """Create the PydanticAI agent with tools and prompts."""
+
+        agent = Agent(
+            model=self.model,
+            deps_type=RagDependencies,
+            system_prompt=RAG_AGENT_SYSTEM_PROMPT,
             **kwargs,
         )
 
         # Register dynamic system prompt for context
+        # (timestamp is minute-granular so the prompt stays identical across quick turns)
         @agent.system_prompt
         async def add_search_context(ctx: RunContext[RagDependencies]) -> str:
             source_info = (
@@ -125,7 +159,7 @@ class RagAgent(BaseAgent[RagDependencies, str]):
 - Project ID: {ctx.deps.project_id or "Global search"}
 - {source_info}
 - Max Results: {ctx.deps.match_count}
-- Timestamp: {datetime.now().isoformat()}
+- Timestamp: {datetime.now().isoformat(timespec="minutes")}
 """
 
         # Register tools for RAG operations
@@ -146,9 +180,7 @@ class RagAgent(BaseAgent[RagDependencies, str]):
                 )
 
                 # Parse the JSON response
-                import json
-
-                result = json.loads(result_json)
+                result = json_loads(result_json)
 
                 if not result.get("success", False):
                     return f"Search failed: {result.get('error', 'Unknown error')}"
@@ -189,14 +221,17 @@ class RagAgent(BaseAgent[RagDependencies, str]):
         async def list_available_sources(ctx: RunContext[RagDependencies]) -> str:
             """List all available sources that can be searched."""
             try:
+                cache_key = ("list_available_sources",)
+                cached = _get_cached_response(cache_key)
+                if cached is not None:
+                    return cached
+
                 # Use MCP client to get available sources
                 mcp_client = await get_mcp_client()
                 result_json = await mcp_client.get_available_sources()
 
                 # Parse the JSON response
-                import json
-
-                result = json.loads(result_json)
+                result = json_loads(result_json)
 
                 if not result.get("success", False):
                     return f"Failed to get sources: {result.get('error', 'Unknown error')}"
@@ -219,7 +254,9 @@ class RagAgent(BaseAgent[RagDependencies, str]):
                         f"- **{source_id}**: {title}{desc_text} (added {created[:10]})"
                     )
 
-                return f"Available sources ({len(sources)} total):\n" + "\n".join(source_list)
+                response = f"Available sources ({len(sources)} total):\n" + "\n".join(source_list)
+                _set_cached_response(cache_key, response)
+                return response
 
             except Exception as e:
                 logger.error(f"Error listing sources: {e}")
@@ -242,9 +279,7 @@ class RagAgent(BaseAgent[RagDependencies, str]):
                 )
 
                 # Parse the JSON response
-                import json
-
-                result = json.loads(result_json)
+                result = json_loads(result_json)
 
                 if not result.get("success", False):
                     return f"Code search failed: {result.get('error', 'Unknown error')}"
@@ -292,13 +327,14 @@ class RagAgent(BaseAgent[RagDependencies, str]):
                 refined_parts = [original_query]
 
                 # Add contextual keywords
-                if "how" in original_query.lower():
+                query_lower = original_query.lower()
+                if "how" in query_lower:
                     refined_parts.append("tutorial guide example")
-                elif "what" in original_query.lower():
+                elif "what" in query_lower:
                     refined_parts.append("definition explanation overview")
-                elif "error" in original_query.lower() or "issue" in original_query.lower():
+                elif "error" in query_lower or "issue" in query_lower:
                     refined_parts.append("troubleshooting solution fix")
-                elif "api" in original_query.lower():
+                elif "api" in query_lower:
                     refined_parts.append("endpoint method parameters response")
 
                 # Add project-specific context if available
@@ -369,26 +405,26 @@ class RagAgent(BaseAgent[RagDependencies, str]):
             sources = []
 
             # Simple analysis of the response to gather metadata
-            if "found" in response_text.lower() and "results" in response_text.lower():
+            response_lower = response_text.lower()
+            if "found" in response_lower and "results" in response_lower:
                 # Try to extract number of results
-                import re
-
-                match = re.search(r"found (\d+)", response_text.lower())
+                match = _RESULTS_FOUND_PATTERN.search(response_lower)
                 if match:
                     results_found = int(match.group(1))
 
-            if "available sources" in response_text.lower():
+            if "available sources" in response_lower:
                 query_type = "list_sources"
-            elif "code example" in response_text.lower():
+            elif "code example" in response_lower:
                 query_type = "code_search"
-            elif "no results" in response_text.lower():
+            elif "no results" in response_lower:
                 results_found = 0
 
             # Extract source references if present
             source_lines = [line for line in response_text.split("\n") if "Source:" in line]
             sources = [line.split("Source:")[-1].strip() for line in source_lines]
 
-            return RagQueryResult(
+            # All fields are produced here from the validated agent output, so skip validation
+            return RagQueryResult.model_construct(
                 query_type=query_type,
                 original_query=user_message,
                 refined_query=None,
@@ -403,7 +439,7 @@ class RagAgent(BaseAgent[RagDependencies, str]):
         except Exception as e:
             self.logger.error(f"RAG query failed: {str(e)}")
             # Return error result
-            return RagQueryResult(
+            return RagQueryResult.model_construct(
                 query_type="error",
                 original_query=user_message,
                 refined_query=None,
@@ -25,6 +25,7 @@ from pydantic import BaseModel
 
 # Import our PydanticAI agents
 from .document_agent import DocumentAgent
+from .mcp_client import close_mcp_client
 from .rag_agent import RagAgent
 
 # Configure logging
@@ -137,6 +138,7 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     logger.info("Shutting down Agents service...")
+    await close_mcp_client()
 
 
 # Create FastAPI app
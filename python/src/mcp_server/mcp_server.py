@@ -14,6 +14,7 @@ Note: Crawling and document upload operations are handled directly by the
 API service and frontend, not through MCP tools.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -57,7 +58,7 @@ logger = logging.getLogger(__name__)
 from src.server.config.logfire_config import mcp_logger, setup_logfire
 
 # Import service client for HTTP calls
-from src.server.services.mcp_service_client import get_mcp_service_client
+from src.server.services.mcp_service_client import close_mcp_service_client, get_mcp_service_client
 
 # Import session management
 from src.server.services.mcp_session_manager import get_session_manager
@@ -498,6 +499,16 @@ except Exception as e:
     raise
 
 
+async def serve() -> None:
+    """Run the streamable HTTP server and release process-wide resources when it stops."""
+    try:
+        await mcp.run_streamable_http_async()
+    finally:
+        # The lifespan above runs once per MCP session, so the shared service client
+        # can only be closed here, once the whole server has shut down
+        await close_mcp_service_client()
+
+
 def main():
     """Main entry point for the MCP server."""
     try:
@@ -511,7 +522,7 @@ def main():
         mcp_logger.info("🔥 Logfire initialized for MCP server")
         mcp_logger.info(f"🌟 Starting MCP server - host={server_host}, port={server_port}")
 
-        mcp.run(transport="streamable-http")
+        asyncio.run(serve())
 
     except Exception as e:
         mcp_logger.error(f"💥 Fatal error in main - error={str(e)}, error_type={type(e).__name__}")
@@ -17,6 +17,20 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/bug-report", tags=["bug-report"])
 
+# Map severity to emoji
+_SEVERITY_EMOJI = {"low": "🟢", "medium": "🟡", "high": "🟠", "critical": "🔴"}
+
+# Map component to emoji
+_COMPONENT_EMOJI = {
+    "knowledge-base": "🔍",
+    "mcp-integration": "🔗",
+    "projects-tasks": "📋",
+    "settings": "⚙️",
+    "ui": "🖥️",
+    "infrastructure": "🐳",
+    "not-sure": "❓",
+}
+
 
 class BugContext(BaseModel):
     error: dict[str, Any]
@@ -112,22 +126,8 @@ class GitHubService:
     def _format_issue_body(self, bug_report: BugReportRequest) -> str:
         """Format the bug report as a GitHub issue body."""
 
-        # Map severity to emoji
-        severity_map = {"low": "🟢", "medium": "🟡", "high": "🟠", "critical": "🔴"}
-
-        # Map component to emoji
-        component_map = {
-            "knowledge-base": "🔍",
-            "mcp-integration": "🔗",
-            "projects-tasks": "📋",
-            "settings": "⚙️",
-            "ui": "🖥️",
-            "infrastructure": "🐳",
-            "not-sure": "❓",
-        }
-
-        severity_emoji = severity_map.get(bug_report.severity, "❓")
-        component_emoji = component_map.get(bug_report.component, "❓")
+        severity_emoji = _SEVERITY_EMOJI.get(bug_report.severity, "❓")
+        component_emoji = _COMPONENT_EMOJI.get(bug_report.component, "❓")
 
         return f"""## {severity_emoji} Bug Report
 
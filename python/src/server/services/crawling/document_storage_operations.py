@@ -6,6 +6,7 @@ Extracted from crawl_orchestration_service.py for better modularity.
 """
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
 
@@ -69,7 +70,7 @@ class DocumentStorageOperations:
         all_chunk_numbers = []
         all_contents = []
         all_metadatas = []
-        source_word_counts = {}
+        source_word_counts: dict[str, int] = defaultdict(int)
         url_to_full_document = {}
         processed_docs = 0
 
@@ -127,7 +128,7 @@ class DocumentStorageOperations:
                 all_metadatas.append(metadata)
 
                 # Accumulate word count
-                source_word_counts[source_id] = source_word_counts.get(source_id, 0) + word_count
+                source_word_counts[source_id] += word_count
 
                 # Yield control every 10 chunks to prevent event loop blocking
                 if i > 0 and i % 10 == 0:
@@ -199,21 +200,17 @@ class DocumentStorageOperations:
         """
         # Find ALL unique source_ids in the crawl results
         unique_source_ids = set()
-        source_id_contents = {}
-        source_id_word_counts = {}
+        source_id_contents: dict[str, list[str]] = defaultdict(list)
+        source_id_word_counts: dict[str, int] = defaultdict(int)
 
         for i, metadata in enumerate(all_metadatas):
             source_id = metadata["source_id"]
             unique_source_ids.add(source_id)
 
             # Group content by source_id for better summaries
-            if source_id not in source_id_contents:
-                source_id_contents[source_id] = []
             source_id_contents[source_id].append(all_contents[i])
 
             # Track word counts per source_id
-            if source_id not in source_id_word_counts:
-                source_id_word_counts[source_id] = 0
             source_id_word_counts[source_id] += metadata.get('word_count', 0)
 
         safe_logfire_info(
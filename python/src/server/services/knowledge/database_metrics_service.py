@@ -4,6 +4,7 @@ Database Metrics Service
 Handles retrieval of database statistics and metrics.
 """
 
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
@@ -96,11 +97,10 @@ class DatabaseMetricsService:
             )
 
             if knowledge_types_result.data:
-                type_counts = {}
-                for row in knowledge_types_result.data:
-                    ktype = row.get("knowledge_type", "unknown")
-                    type_counts[ktype] = type_counts.get(ktype, 0) + 1
-                stats["knowledge_type_distribution"] = type_counts
+                type_counts = Counter(
+                    row.get("knowledge_type", "unknown") for row in knowledge_types_result.data
+                )
+                stats["knowledge_type_distribution"] = dict(type_counts)
 
             # Get recent activity
             recent_sources = (
@@ -5,11 +5,13 @@ This module provides HTTP clients for the MCP service to communicate with
 other services (API and Agents) instead of importing their modules directly.
 """
 
+import asyncio
 import uuid
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
+import orjson
 
 from ..config.logfire_config import mcp_logger
 from ..config.service_discovery import get_agents_url, get_api_url
@@ -21,9 +23,11 @@ class MCPServiceClient:
     Replaces direct module imports with proper service-to-service communication.
     """
 
-    def __init__(self):
-        self.api_url = get_api_url()
-        self.agents_url = get_agents_url()
+    def __init__(self, api_url: str | None = None, agents_url: str | None = None):
+        # Explicit URLs skip service discovery (useful for tests and one-off clients);
+        # everything else should share the instance from get_mcp_service_client()
+        self.api_url = api_url if api_url is not None else get_api_url()
+        self.agents_url = agents_url if agents_url is not None else get_agents_url()
         self.service_auth = "mcp-service-key"  # In production, use proper key management
         self.timeout = httpx.Timeout(
             connect=5.0,
@@ -31,6 +35,22 @@ class MCPServiceClient:
             write=30.0,
             pool=5.0,
         )
+        # Bound the shared pool; MCP tool calls fan out to at most a handful of services
+        self.limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use so connections are reused across calls."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _get_headers(self, request_id: str | None = None) -> dict[str, str]:
         """Get common headers for internal requests"""
@@ -64,23 +84,22 @@ class MCPServiceClient:
             "metadata": options or {},
         }
 
-        mcp_logger.info(f"Calling API service to crawl {url}")
+        mcp_logger.info("Calling API service to crawl %s", url)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    endpoint, json=request_data, headers=self._get_headers()
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                # Transform API response to MCP expected format
-                return {
-                    "success": result.get("success", False),
-                    "progressId": result.get("progressId"),
-                    "message": result.get("message", "Crawling started"),
-                    "error": None if result.get("success") else {"message": "Crawl failed"},
-                }
+            response = await self.client.post(
+                endpoint, content=orjson.dumps(request_data), headers=self._get_headers()
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            # Transform API response to MCP expected format
+            return {
+                "success": result.get("success", False),
+                "progressId": result.get("progressId"),
+                "message": result.get("message", "Crawling started"),
+                "error": None if result.get("success") else {"message": "Crawl failed"},
+            }
         except httpx.TimeoutException:
             mcp_logger.error(f"Timeout crawling {url}")
             return {
@@ -117,24 +136,23 @@ class MCPServiceClient:
         endpoint = urljoin(self.api_url, "/api/rag/query")
         request_data = {"query": query, "source": source_filter, "match_count": match_count}
 
-        mcp_logger.info(f"Calling API service to search: {query}")
+        mcp_logger.info("Calling API service to search: %s", query)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # First, get search results from API service
-                response = await client.post(
-                    endpoint, json=request_data, headers=self._get_headers()
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                # Transform API response to MCP expected format
-                return {
-                    "success": result.get("success", True),
-                    "results": result.get("results", []),
-                    "reranked": False,  # Reranking should be handled by Server's service layer
-                    "error": None,
-                }
+            # First, get search results from API service
+            response = await self.client.post(
+                endpoint, content=orjson.dumps(request_data), headers=self._get_headers()
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            # Transform API response to MCP expected format
+            return {
+                "success": result.get("success", True),
+                "results": result.get("results", []),
+                "reranked": False,  # Reranking should be handled by Server's service layer
+                "error": None,
+            }
 
         except Exception as e:
             mcp_logger.error(f"Error searching: {str(e)}")
@@ -196,29 +214,31 @@ class MCPServiceClient:
         Returns:
             Combined health status
         """
-        health_status = {"api_service": False, "agents_service": False}
-
-        # Check API service
         api_health_url = urljoin(self.api_url, "/api/health")
-        try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                mcp_logger.info(f"Checking API service health at: {api_health_url}")
-                response = await client.get(api_health_url)
-                health_status["api_service"] = response.status_code == 200
-                mcp_logger.info(f"API service health check: {response.status_code}")
-        except Exception as e:
-            health_status["api_service"] = False
-            mcp_logger.warning(f"API service health check failed: {e}")
+        agents_health_url = urljoin(self.agents_url, "/health")
+        health_timeout = httpx.Timeout(5.0)
 
-        # Check Agents service
-        try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                response = await client.get(urljoin(self.agents_url, "/health"))
-                health_status["agents_service"] = response.status_code == 200
-        except Exception:
-            pass
+        async def check_api() -> bool:
+            try:
+                mcp_logger.info("Checking API service health at: %s", api_health_url)
+                response = await self.client.get(api_health_url, timeout=health_timeout)
+                mcp_logger.info("API service health check: %s", response.status_code)
+                return response.status_code == 200
+            except Exception as e:
+                mcp_logger.warning(f"API service health check failed: {e}")
+                return False
+
+        async def check_agents() -> bool:
+            try:
+                response = await self.client.get(agents_health_url, timeout=health_timeout)
+                return response.status_code == 200
+            except Exception:
+                return False
+
+        # The two services are independent, so probe them concurrently
+        api_healthy, agents_healthy = await asyncio.gather(check_api(), check_agents())
 
-        return health_status
+        return {"api_service": api_healthy, "agents_service": agents_healthy}
 
 
 # Global client instance
@@ -231,3 +251,11 @@ def get_mcp_service_client() -> MCPServiceClient:
     if _mcp_client is None:
         _mcp_client = MCPServiceClient()
     return _mcp_client
+
+
+async def close_mcp_service_client() -> None:
+    """Close the global MCP service client, if one was created."""
+    global _mcp_client
+    if _mcp_client is not None:
+        await _mcp_client.close()
+        _mcp_client = None
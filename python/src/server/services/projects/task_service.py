@@ -5,7 +5,8 @@ This module provides core business logic for task operations that can be
 shared between MCP tools and FastAPI endpoints.
 """
 
-# Removed direct logging import - using unified config
+import logging
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
@@ -210,26 +211,27 @@ class TaskService:
 
             # Debug: Log task status distribution and filter effectiveness
             if response.data:
-                status_counts = {}
-                archived_counts = {"null": 0, "true": 0, "false": 0}
-
-                for task in response.data:
-                    task_status = task.get("status", "unknown")
-                    status_counts[task_status] = status_counts.get(task_status, 0) + 1
-
-                    # Check archived field
-                    archived_value = task.get("archived")
-                    if archived_value is None:
-                        archived_counts["null"] += 1
-                    elif archived_value is True:
-                        archived_counts["true"] += 1
-                    else:
-                        archived_counts["false"] += 1
-
-                logger.debug(
-                    f"Retrieved {len(response.data)} tasks. Status distribution: {status_counts}"
-                )
-                logger.debug(f"Archived field distribution: {archived_counts}")
+                # Only walk the result set when the distribution will actually be logged
+                if logger.isEnabledFor(logging.DEBUG):
+                    status_counts = Counter()
+                    archived_counts = {"null": 0, "true": 0, "false": 0}
+
+                    for task in response.data:
+                        status_counts[task.get("status", "unknown")] += 1
+
+                        # Check archived field
+                        archived_value = task.get("archived")
+                        if archived_value is None:
+                            archived_counts["null"] += 1
+                        elif archived_value is True:
+                            archived_counts["true"] += 1
+                        else:
+                            archived_counts["false"] += 1
+
+                    logger.debug(
+                        f"Retrieved {len(response.data)} tasks. Status distribution: {dict(status_counts)}"
+                    )
+                    logger.debug(f"Archived field distribution: {archived_counts}")
 
                 # If we're filtering by status and getting wrong results, log sample
                 if status and len(response.data) > 0:
@@ -440,28 +442,23 @@ class TaskService:
                 logger.debug("No tasks found")
                 return True, {}
 
-            # Process results into counts by project and status
+            # Count (project, status) pairs in one pass, then fold them into
+            # per-project counts - the loop below only sees distinct pairs
+            pair_counts = Counter((task.get("project_id"), task.get("status")) for task in response.data)
             counts_by_project = {}
 
-            for task in response.data:
-                project_id = task.get("project_id")
-                status = task.get("status")
-
+            for (project_id, status), count in pair_counts.items():
                 if not project_id or not status:
                     continue
 
                 # Initialize project counts if not exists
-                if project_id not in counts_by_project:
-                    counts_by_project[project_id] = {
-                        "todo": 0,
-                        "doing": 0,
-                        "review": 0,
-                        "done": 0
-                    }
+                project_counts = counts_by_project.get(project_id)
+                if project_counts is None:
+                    project_counts = counts_by_project[project_id] = dict.fromkeys(self.VALID_STATUSES, 0)
 
                 # Count all statuses separately
-                if status in ["todo", "doing", "review", "done"]:
-                    counts_by_project[project_id][status] += 1
+                if status in project_counts:
+                    project_counts[status] += count
 
             logger.debug(f"Task counts fetched for {len(counts_by_project)} projects")
 
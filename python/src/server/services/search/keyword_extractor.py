@@ -6,9 +6,10 @@ Uses lightweight Python string operations without heavy NLP dependencies.
 """
 
 import re
+from functools import lru_cache
 
 # Common stop words to filter out
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     "a",
     "an",
     "and",
@@ -78,10 +79,10 @@ STOP_WORDS = {
     "not",
     "no",
     "yes",
-}
+})
 
 # Technical stop words that are too common in code/docs to be useful
-TECHNICAL_STOP_WORDS = {
+TECHNICAL_STOP_WORDS = frozenset({
     "get",
     "set",
     "use",
@@ -117,10 +118,10 @@ TECHNICAL_STOP_WORDS = {
     "implementing",
     "implemented",
     "implementation",
-}
+})
 
 # Common programming keywords to preserve (not filter out)
-PRESERVE_KEYWORDS = {
+PRESERVE_KEYWORDS = frozenset({
     "api",
     "auth",
     "authentication",
@@ -236,7 +237,24 @@ PRESERVE_KEYWORDS = {
     "sessions",
     "cookie",
     "cookies",
-}
+})
+
+# Multi-word phrases folded into a single keyword, e.g. "best practices" -> best_practices
+_COMPOUND_PATTERNS = tuple(
+    (re.compile(pattern), replacement)
+    for pattern, replacement in (
+        (r"best\s+practice[s]?", "best_practices"),
+        (r"how\s+to", "howto"),
+        (r"step\s+by\s+step", "step_by_step"),
+        (r"real\s+time", "realtime"),
+        (r"full\s+text", "fulltext"),
+        (r"full[\s-]?stack", "fullstack"),
+        (r"back[\s-]?end", "backend"),
+        (r"front[\s-]?end", "frontend"),
+        (r"data[\s-]?base", "database"),
+        (r"web[\s-]?socket", "websocket"),
+    )
+)
 
 
 class KeywordExtractor:
@@ -283,21 +301,8 @@ class KeywordExtractor:
 
         # Step 3: Handle special cases and compound terms
         # Look for common patterns like "best practices", "how to", etc.
-        compound_patterns = [
-            (r"best\s+practice[s]?", "best_practices"),
-            (r"how\s+to", "howto"),
-            (r"step\s+by\s+step", "step_by_step"),
-            (r"real\s+time", "realtime"),
-            (r"full\s+text", "fulltext"),
-            (r"full[\s-]?stack", "fullstack"),
-            (r"back[\s-]?end", "backend"),
-            (r"front[\s-]?end", "frontend"),
-            (r"data[\s-]?base", "database"),
-            (r"web[\s-]?socket", "websocket"),
-        ]
-
-        for pattern, replacement in compound_patterns:
-            if re.search(pattern, query_lower):
+        for pattern, replacement in _COMPOUND_PATTERNS:
+            if pattern.search(query_lower):
                 keywords.append(replacement)
 
         # Step 4: Deduplicate while preserving order
@@ -329,6 +334,7 @@ class KeywordExtractor:
             Keywords sorted by priority
         """
         keyword_scores = []
+        query_lower = original_query.lower()
 
         for keyword in keywords:
             score = 0
@@ -350,14 +356,14 @@ class KeywordExtractor:
                 score += 1
 
             # Check if it appears multiple times (important term)
-            count = original_query.lower().count(keyword)
+            count = query_lower.count(keyword)
             if count > 1:
                 score += (count - 1) * 2  # Give more weight to repeated terms
 
             keyword_scores.append((keyword, score))
 
-        # Sort by score (descending) then by original order
-        keyword_scores.sort(key=lambda x: (-x[1], keywords.index(x[0])))
+        # Sort by score (descending); the sort is stable, so ties keep their original order
+        keyword_scores.sort(key=lambda x: -x[1])
 
         return [kw for kw, _ in keyword_scores]
 
@@ -433,7 +439,14 @@ def extract_keywords(query: str, min_length: int = 2, max_keywords: int = 10) ->
     Returns:
         List of extracted keywords
     """
-    return keyword_extractor.extract_keywords(query, min_length, max_keywords)
+    # Copy so callers can't mutate the cached result
+    return list(_extract_keywords_cached(query, min_length, max_keywords))
+
+
+@lru_cache(maxsize=1024)
+def _extract_keywords_cached(query: str, min_length: int, max_keywords: int) -> tuple[str, ...]:
+    """Memoized keyword extraction; the same query is often searched more than once."""
+    return tuple(keyword_extractor.extract_keywords(query, min_length, max_keywords))
 
 
 def build_search_terms(keywords: list[str]) -> list[str]:
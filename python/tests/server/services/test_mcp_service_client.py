@@ -0,0 +1,132 @@
+"""Unit tests for the MCP service client."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.server.services.mcp_service_client import MCPServiceClient
+
+
+@pytest.fixture
+def mock_async_client_class():
+    """Patch httpx.AsyncClient so the service client's pooled HTTP client is an AsyncMock."""
+    with patch("src.server.services.mcp_service_client.httpx.AsyncClient") as mock_client_class:
+        mock_async_client = AsyncMock()
+        mock_async_client.is_closed = False
+        mock_client_class.return_value = mock_async_client
+        yield mock_client_class
+
+
+def _mock_get(status_by_suffix: dict[str, int]):
+    """Build an AsyncClient.get mock that answers based on the URL suffix."""
+
+    async def get(url, *args, **kwargs):
+        for suffix, status in status_by_suffix.items():
+            if url.endswith(suffix):
+                if status is None:
+                    raise httpx.ConnectError("connection refused")
+                response = MagicMock()
+                response.status_code = status
+                return response
+        raise AssertionError(f"Unexpected URL: {url}")
+
+    return get
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_both_services(mock_async_client_class):
+    """Both dependent services are reported healthy when they answer 200."""
+    http_client = mock_async_client_class.return_value
+    http_client.get.side_effect = _mock_get({"/api/health": 200, "/health": 200})
+
+    result = await MCPServiceClient().health_check()
+
+    assert result == {"api_service": True, "agents_service": True}
+    assert http_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_health_check_isolates_agents_failure(mock_async_client_class):
+    """An unreachable agents service does not affect the API service result."""
+    http_client = mock_async_client_class.return_value
+    http_client.get.side_effect = _mock_get({"/api/health": 200, "/health": None})
+
+    result = await MCPServiceClient().health_check()
+
+    assert result == {"api_service": True, "agents_service": False}
+
+
+@pytest.mark.asyncio
+async def test_health_check_probes_services_concurrently(mock_async_client_class):
+    """Each probe only completes once the other has started, so they must overlap."""
+    api_started = asyncio.Event()
+    agents_started = asyncio.Event()
+
+    async def get(url, *args, **kwargs):
+        started, other_started = (
+            (api_started, agents_started) if url.endswith("/api/health") else (agents_started, api_started)
+        )
+        started.set()
+        # Sequential probes would time out here and be reported unhealthy
+        await asyncio.wait_for(other_started.wait(), timeout=1.0)
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    mock_async_client_class.return_value.get.side_effect = get
+
+    result = await MCPServiceClient().health_check()
+
+    assert result == {"api_service": True, "agents_service": True}
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_reused_until_closed(mock_async_client_class):
+    """Calls share one pooled HTTP client, and close() releases it."""
+    http_client = mock_async_client_class.return_value
+    http_client.get.side_effect = _mock_get({"/api/health": 200, "/health": 200})
+    client = MCPServiceClient()
+
+    await client.health_check()
+    await client.health_check()
+    assert mock_async_client_class.call_count == 1
+
+    await client.close()
+
+    http_client.aclose.assert_awaited_once()
+    assert client._client is None
+
+
+@pytest.mark.asyncio
+async def test_search_encodes_request_and_decodes_response(mock_async_client_class):
+    """search() sends a JSON body and maps the API response to the MCP shape."""
+    http_client = mock_async_client_class.return_value
+    http_client.post.return_value = httpx.Response(
+        200,
+        json={"success": True, "results": [{"content": "hello"}]},
+        request=httpx.Request("POST", "http://api/api/rag/query"),
+    )
+
+    result = await MCPServiceClient().search("hello", source_filter="docs", match_count=3)
+
+    body = http_client.post.call_args.kwargs["content"]
+    assert json.loads(body) == {"query": "hello", "source": "docs", "match_count": 3}
+    assert result["success"] is True
+    assert result["results"] == [{"content": "hello"}]
+
+
+def test_explicit_urls_skip_service_discovery():
+    """URLs passed to the constructor are used as-is without consulting discovery."""
+    with (
+        patch("src.server.services.mcp_service_client.get_api_url") as mock_api_url,
+        patch("src.server.services.mcp_service_client.get_agents_url") as mock_agents_url,
+    ):
+        client = MCPServiceClient(api_url="http://api:8181", agents_url="http://agents:8052")
+
+    assert client.api_url == "http://api:8181"
+    assert client.agents_url == "http://agents:8052"
+    mock_api_url.assert_not_called()
+    mock_agents_url.assert_not_called()
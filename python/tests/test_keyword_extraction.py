@@ -158,6 +158,17 @@ class TestSearchTermBuilder:
 class TestIntegration:
     """Integration tests for keyword extraction in search context"""
 
+    def test_cached_results_are_not_shared(self):
+        """Test that repeated queries return independent lists"""
+        query = "React hooks state management"
+        first = extract_keywords(query)
+        first.append("mutated")
+
+        second = extract_keywords(query)
+
+        assert "mutated" not in second
+        assert second == first[:-1]
+
     def test_real_world_query_1(self):
         """Test with real-world query example 1"""
         query = "How to implement JWT authentication in FastAPI with Supabase"